@@ -0,0 +1,106 @@
+"""
+embedding_cache.py — Persistent paper-embedding cache for the semantic layer.
+
+Papers stay inside the fetch window for several runs, backfill checks
+re-fetch recent days, and --refilter re-scores every stored day, so most
+papers reaching the semantic layer were already embedded by an earlier run.
+Embeddings are kept in .cache/embeddings/{model}.npz (or $EMBEDDING_CACHE_DIR)
+and only cache misses go through the transformer.
+
+Rows are keyed by a hash of the exact text that was encoded, not the paper
+ID — a revised abstract, or a change to how the text is built, simply misses
+and gets re-encoded. Stored vectors are already L2-normalised and kept as
+float16, which halves the file and load I/O; they are widened back to
+float32 on load because numpy has no BLAS path for float16 matmuls. Fresh
+encodings get the same float16 round-trip before use, so scores never
+depend on whether a row was a cache hit.
+
+The file keeps at most MAX_ENTRIES rows; the least recently used are
+dropped first. It is a pure cache: deleting .cache/ is always safe.
+"""
+
+import hashlib
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+ROOT        = Path(__file__).parent.parent
+CACHE_DIR   = Path(os.environ.get("EMBEDDING_CACHE_DIR", ROOT / ".cache" / "embeddings")).expanduser()
+MAX_ENTRIES = 50_000   # ~38 MB at 384 float16 dims
+
+
+def _cache_path(model_name: str) -> Path:
+    return CACHE_DIR / f"{model_name.replace('/', '--')}.npz"
+
+
+def _text_key(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _load(model_name: str) -> tuple[list[str], np.ndarray | None]:
+    path = _cache_path(model_name)
+    if not path.exists():
+        return [], None
+    try:
+        with np.load(path) as npz:
+            return npz["keys"].tolist(), npz["embeddings"].astype(np.float32)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[embcache] Ignoring unreadable cache {path.name} ({e}).")
+        return [], None
+
+
+def _save(model_name: str, keys: list[str], embeddings: np.ndarray) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(model_name)
+    tmp  = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, keys=np.array(keys), embeddings=embeddings.astype(np.float16))
+    os.replace(tmp, path)   # never leave a half-written cache behind
+    print(f"[embcache] Saved {len(keys)} embeddings → {path.name}")
+
+
+def encode_cached(
+    texts: list[str],
+    model_name: str,
+    encode: Callable[[list[str]], np.ndarray],
+) -> np.ndarray:
+    """
+    Return one normalised embedding per text (row i ↔ texts[i]).
+    Cached rows are reused; only misses are passed to encode(). The file is
+    rewritten when there are new rows, or when this run's hits change the
+    recency order.
+    """
+    keys = [_text_key(t) for t in texts]
+    cached_keys, cached = _load(model_name)
+    row_of = {k: i for i, k in enumerate(cached_keys)}
+
+    misses = {k: t for k, t in zip(keys, texts) if k not in row_of}
+    hits   = sum(k in row_of for k in keys)
+    print(f"[embcache] {hits} cached, {len(misses)} to encode.")
+
+    # Rows used this run move to the end so eviction (which trims from the
+    # front) drops the least recently used first.
+    used      = set(keys)
+    keep_rows = [i for i, k in enumerate(cached_keys) if k not in used] + \
+                [row_of[k] for k in dict.fromkeys(keys) if k in row_of]
+    if not misses and keep_rows == list(range(len(cached_keys))):
+        return cached[[row_of[k] for k in keys]]   # all hits, already in LRU order
+
+    parts = [] if cached is None else [cached[keep_rows]]
+    if misses:
+        # Round-trip through float16 like stored rows, so a paper scores the
+        # same whether its embedding was just encoded or read back from the cache.
+        fresh = np.asarray(encode(list(misses.values())), dtype=np.float32)
+        parts.append(fresh.astype(np.float16).astype(np.float32))
+    all_keys  = [cached_keys[i] for i in keep_rows] + list(misses)
+    all_rows  = np.vstack(parts)
+    limit     = max(MAX_ENTRIES, len(used))   # never evict rows needed right now
+    if len(all_keys) > limit:
+        all_keys = all_keys[-limit:]
+        all_rows = all_rows[-limit:]
+    _save(model_name, all_keys, all_rows)
+
+    row_of = {k: i for i, k in enumerate(all_keys)}
+    return all_rows[[row_of[k] for k in keys]]
@@ -9,28 +9,56 @@ Past days are loaded from storage, not fetched live.
 Date clock: UTC, matching arXiv's own submission-day boundary.
 The pipeline runs just after 00:00 UTC so each run captures the
 previous UTC day's complete paper set.
+
+All chunk requests share one keep-alive HTTPS connection to arXiv, so a
+multi-page fetch pays the TCP + TLS handshake once instead of per page.
+Response bodies are fed to an incremental XML parser as they are read.
 """
 
+import atexit
+import http.client
+import re
 import time
-import urllib.request
+import urllib.error
 import urllib.parse
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import takewhile
+from sys import intern
 from datetime import datetime, timezone, timedelta, date
 
 
-ARXIV_API     = "https://export.arxiv.org/api/query"
+ARXIV_HOST    = "export.arxiv.org"
+ARXIV_PATH    = "/api/query"
 CHUNK_SIZE    = 300
 REQUEST_DELAY = 3
-MAX_RETRIES   = 3
-
-NS = {"atom": "http://www.w3.org/2005/Atom"}
+MAX_RETRIES   = 4
+BACKOFF_MAX   = 30
+RETRY_STATUS  = {429, 500, 502, 503, 504}
+READ_SIZE     = 64 * 1024   # bytes fed to the XML parser per socket read
+
+# Atom element names in Clark notation — avoids prefix resolution per lookup
+_ATOM         = "{http://www.w3.org/2005/Atom}"
+ENTRY_TAG     = _ATOM + "entry"
+ID_TAG        = _ATOM + "id"
+TITLE_TAG     = _ATOM + "title"
+SUMMARY_TAG   = _ATOM + "summary"
+AUTHOR_TAG    = _ATOM + "author"
+NAME_TAG      = _ATOM + "name"
+PUBLISHED_TAG = _ATOM + "published"
+UPDATED_TAG   = _ATOM + "updated"
+CATEGORY_TAG  = _ATOM + "category"
+
+_WS = re.compile(r"\s+")   # collapses arXiv's hard-wrapped title/abstract whitespace
 
 UTC = timezone.utc
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
+    # published/updated are always UTC-aware, so .date() is already the UTC date
     id:         str
     title:      str
     abstract:   str
@@ -41,51 +69,196 @@ class Paper:
     categories: list[str]
 
 
-def _fetch_chunk(category_query: str, start: int) -> list[Paper]:
-    params = urllib.parse.urlencode({
-        "search_query": category_query,
+# ── HTTP: connection reuse + request pacing ───────────────────────────────────
+
+_conn: http.client.HTTPSConnection | None = None
+_last_request_at = float("-inf")   # monotonic time the previous response finished
+
+
+def _throttle() -> None:
+    """
+    Keep REQUEST_DELAY seconds between consecutive arXiv requests, counted
+    from when the previous response finished. Time already spent parsing and
+    grouping that page counts toward the delay instead of adding to it.
+    """
+    wait = REQUEST_DELAY - (time.monotonic() - _last_request_at)
+    if wait > 0:
+        print(f"[fetcher] Waiting {wait:.1f}s…")
+        time.sleep(wait)
+
+
+def _close_conn() -> None:
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+atexit.register(_close_conn)
+
+
+def _get_feed(path: str) -> list[Paper]:
+    """
+    GET a feed page over the shared keep-alive connection and parse the body
+    as it arrives off the socket — no full-page bytes buffer is built.
+    If the server dropped the idle connection between pages, reconnect once
+    immediately rather than burning a retry + backoff on it.
+    """
+    global _conn, _last_request_at
+    _throttle()
+    while True:
+        fresh = _conn is None
+        if fresh:
+            _conn = http.client.HTTPSConnection(ARXIV_HOST, timeout=30)
+        try:
+            _conn.request("GET", path)
+            resp = _conn.getresponse()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _close_conn()
+            if fresh:
+                raise
+        except Exception:
+            _close_conn()
+            raise
+
+    try:
+        if resp.status != 200:
+            raise urllib.error.HTTPError(f"https://{ARXIV_HOST}{path}", resp.status,
+                                         resp.reason, resp.headers, None)
+        return _parse_feed(iter(lambda: resp.read(READ_SIZE), b""))
+    except Exception:
+        _close_conn()   # body may be partly unread — socket can't be reused
+        raise
+    finally:
+        _last_request_at = time.monotonic()
+
+
+def _base_query(categories: list[str]) -> str:
+    """URL-encoded query string shared by every page of one listing (all but start)."""
+    return urllib.parse.urlencode({
+        "search_query": " OR ".join(f"cat:{c}" for c in categories),
         "sortBy":       "submittedDate",
         "sortOrder":    "descending",
-        "start":        start,
         "max_results":  CHUNK_SIZE,
     })
-    url = f"{ARXIV_API}?{params}"
+
+
+def _retry_wait(attempt: int, err: Exception) -> float | None:
+    """
+    Seconds to wait before retrying after err, or None if it isn't retryable.
+    Exponential backoff (3s, 6s, 12s, … capped at BACKOFF_MAX). An explicit
+    Retry-After on a 429/503 is honoured up to the same cap. Other HTTP
+    statuses (e.g. 400 on a bad query) fail straight away.
+    """
+    wait = min(BACKOFF_MAX, REQUEST_DELAY * 2 ** attempt)
+    if isinstance(err, urllib.error.HTTPError):
+        if err.code not in RETRY_STATUS:
+            return None
+        retry_after = (err.headers or {}).get("Retry-After", "")
+        if retry_after.isdigit():
+            wait = min(BACKOFF_MAX, max(wait, int(retry_after)))
+    return wait
+
+
+def _fetch_chunk(base_query: str, start: int) -> list[Paper]:
+    path = f"{ARXIV_PATH}?{base_query}&start={start}"
     for attempt in range(MAX_RETRIES):
         try:
-            with urllib.request.urlopen(url, timeout=30) as resp:
-                xml_data = resp.read()
-            break
-        except (TimeoutError, urllib.error.URLError) as e:
-            if attempt < MAX_RETRIES - 1:
-                wait = REQUEST_DELAY * (attempt + 2)
-                print(f"[fetcher] Attempt {attempt+1} failed ({e}), retrying in {wait}s…")
-                time.sleep(wait)
-            else:
+            return _get_feed(path)
+        except (OSError, http.client.HTTPException) as e:
+            wait = _retry_wait(attempt, e)
+            if wait is None or attempt == MAX_RETRIES - 1:
                 raise
+            print(f"[fetcher] Attempt {attempt+1} failed ({e}), retrying in {wait}s…")
+            time.sleep(wait)
+
 
-    root   = ET.fromstring(xml_data)
+def _parse_arxiv_ts(s: str) -> datetime:
+    """
+    Parse arXiv's fixed-width "YYYY-MM-DDTHH:MM:SSZ" timestamps by slicing,
+    which skips fromisoformat's generic tz handling and the "Z" replace.
+    Anything not in that exact shape falls back to fromisoformat.
+    """
+    if len(s) != 20 or s[-1] != "Z":
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=UTC)
+
+
+def _entry_to_paper(entry: ET.Element) -> Paper:
+    raw_id   = entry.find(ID_TAG).text.strip()
+    short_id = raw_id.split("/abs/")[-1].split("v")[0]
+    title    = _WS.sub(" ", entry.find(TITLE_TAG).text).strip()
+    abstract = _WS.sub(" ", entry.find(SUMMARY_TAG).text).strip()
+    # Intern names + categories: the same few strings recur across thousands
+    # of papers in a multi-day fetch, so they share one object each.
+    authors  = [intern(a.find(NAME_TAG).text.strip())
+                for a in entry.findall(AUTHOR_TAG)]
+    published  = _parse_arxiv_ts(entry.find(PUBLISHED_TAG).text.strip())
+    updated    = _parse_arxiv_ts(entry.find(UPDATED_TAG).text.strip())
+    categories = [intern(tag.get("term")) for tag in entry.findall(CATEGORY_TAG)]
+
+    return Paper(
+        id=short_id, title=title, abstract=abstract,
+        authors=authors, url=f"https://arxiv.org/abs/{short_id}",
+        published=published, updated=updated, categories=categories,
+    )
+
+
+def _parse_feed(chunks: Iterable[bytes]) -> list[Paper]:
+    """
+    Incrementally parse an Atom feed delivered as a stream of byte chunks.
+    Each <entry> is converted as soon as its end tag is seen and then
+    cleared, so neither the raw body nor the full element tree for a
+    300-entry page is ever held in memory at once.
+    """
+    parser = ET.XMLPullParser(events=("end",))
     papers = []
-    for entry in root.findall("atom:entry", NS):
-        raw_id   = entry.find("atom:id", NS).text.strip()
-        short_id = raw_id.split("/abs/")[-1].split("v")[0]
-        title    = entry.find("atom:title",   NS).text.strip().replace("\n", " ")
-        abstract = entry.find("atom:summary", NS).text.strip().replace("\n", " ")
-        authors  = [a.find("atom:name", NS).text.strip()
-                    for a in entry.findall("atom:author", NS)]
-        published = datetime.fromisoformat(
-            entry.find("atom:published", NS).text.strip().replace("Z", "+00:00"))
-        updated = datetime.fromisoformat(
-            entry.find("atom:updated", NS).text.strip().replace("Z", "+00:00"))
-        categories = [tag.get("term") for tag in entry.findall("atom:category", NS)]
-
-        papers.append(Paper(
-            id=short_id, title=title, abstract=abstract,
-            authors=authors, url=f"https://arxiv.org/abs/{short_id}",
-            published=published, updated=updated, categories=categories,
-        ))
+
+    def drain() -> None:
+        for _, el in parser.read_events():
+            if el.tag == ENTRY_TAG:
+                papers.append(_entry_to_paper(el))
+                el.clear()
+
+    for data in chunks:
+        parser.feed(data)
+        drain()
+    parser.close()
+    drain()
     return papers
 
 
+def _iter_pages(categories: list[str], max_results: int) -> Iterator[list[Paper]]:
+    """
+    Paginate the arXiv listing newest-first, yielding one page of papers at a
+    time with IDs already seen on earlier pages dropped. Stops on max_results,
+    an empty response, or a partial page. Callers simply stop iterating once
+    they are past their date window, and no further pages are requested.
+    """
+    base_query = _base_query(categories)
+    seen_ids: set[str] = set()
+    start = 0
+
+    while start < max_results:
+        print(f"[fetcher] Requesting papers {start+1}–{start+CHUNK_SIZE}…")
+        chunk = _fetch_chunk(base_query, start)
+
+        if not chunk:
+            print("[fetcher] Empty response — stopping.")
+            return
+
+        page = [p for p in chunk if p.id not in seen_ids]
+        seen_ids.update(p.id for p in page)
+        yield page
+
+        if len(chunk) < CHUNK_SIZE:
+            print("[fetcher] Partial page — end of results.")
+            return
+        start += CHUNK_SIZE
+
+
 def fetch_today(
     categories: list[str] = ["cs.AI"],
     max_results: int = 2000,
@@ -96,46 +269,21 @@ def fetch_today(
 
     Returns (today_utc, papers).
     """
-    today_utc    = datetime.now(UTC).date()
-    cat_query    = " OR ".join(f"cat:{c}" for c in categories)
-    all_papers:  list[Paper] = []
-    seen_ids:    set[str]    = set()
-    start = 0
+    today_utc   = datetime.now(UTC).date()
+    all_papers: list[Paper] = []
 
     print(f"[fetcher] Fetching today's papers ({today_utc} UTC) from {categories}…")
 
-    while start < max_results:
-        print(f"[fetcher] Requesting papers {start+1}–{start+CHUNK_SIZE}…")
-        chunk = _fetch_chunk(cat_query, start)
-
-        if not chunk:
-            print("[fetcher] Empty response — stopping.")
-            break
-
-        new_today = []
-        hit_old   = False
-        for p in chunk:
-            if p.updated.astimezone(UTC).date() >= today_utc:
-                if p.id not in seen_ids:
-                    seen_ids.add(p.id)
-                    new_today.append(p)
-            else:
-                hit_old = True
-                break  # sorted newest-first; everything after is older
-
+    for page in _iter_pages(categories, max_results):
+        # sorted newest-first; everything after the first older paper is older
+        new_today = list(takewhile(
+            lambda p: p.updated.date() >= today_utc, page))
         all_papers.extend(new_today)
         print(f"[fetcher] +{len(new_today)} (total today: {len(all_papers)})")
 
-        if hit_old:
+        if len(new_today) < len(page):
             print("[fetcher] Reached yesterday — done.")
             break
-        if len(chunk) < CHUNK_SIZE:
-            print("[fetcher] Partial page — end of results.")
-            break
-
-        start += CHUNK_SIZE
-        print(f"[fetcher] Waiting {REQUEST_DELAY}s…")
-        time.sleep(REQUEST_DELAY)
 
     print(f"[fetcher] Done. {len(all_papers)} papers for {today_utc}.")
     return today_utc, all_papers
@@ -153,33 +301,19 @@ def fetch_recent_days(
     Returns dict: date → [Paper, ...], sorted newest-first.
     Much more efficient than calling fetch_date() per day separately.
     """
-    from collections import defaultdict
-
     today_utc = datetime.now(UTC).date()
     cutoff    = today_utc - timedelta(days=num_days - 1)
-    cat_query = " OR ".join(f"cat:{c}" for c in categories)
     grouped:  dict[date, list[Paper]] = defaultdict(list)
-    seen_ids: set[str] = set()
-    start = 0
 
     print(f"[fetcher] Fetching {num_days} days ({cutoff} → {today_utc} UTC)…")
 
-    while start < max_results:
-        print(f"[fetcher] Requesting papers {start+1}–{start+CHUNK_SIZE}…")
-        chunk = _fetch_chunk(cat_query, start)
-
-        if not chunk:
-            print("[fetcher] Empty response — stopping.")
-            break
-
+    for page in _iter_pages(categories, max_results):
         all_too_old = True
-        for p in chunk:
-            paper_date = p.updated.astimezone(UTC).date()
+        for p in page:
+            paper_date = p.updated.date()
             if paper_date >= cutoff:
                 all_too_old = False
-                if p.id not in seen_ids:
-                    seen_ids.add(p.id)
-                    grouped[paper_date].append(p)
+                grouped[paper_date].append(p)
 
         total = sum(len(v) for v in grouped.values())
         print(f"[fetcher] {total} papers in window so far across {len(grouped)} days.")
@@ -187,16 +321,9 @@ def fetch_recent_days(
         if all_too_old:
             print("[fetcher] All papers older than window — stopping.")
             break
-        if len(chunk) < CHUNK_SIZE:
-            print("[fetcher] Partial page — end of results.")
-            break
-
-        start += CHUNK_SIZE
-        print(f"[fetcher] Waiting {REQUEST_DELAY}s…")
-        time.sleep(REQUEST_DELAY)
 
     result = dict(sorted(grouped.items(), reverse=True))
     for d, papers in result.items():
         print(f"[fetcher]   {d}: {len(papers)} papers")
     print(f"[fetcher] Done. {sum(len(v) for v in result.values())} total papers.")
-    return result
\ No newline at end of file
+    return result
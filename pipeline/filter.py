@@ -8,14 +8,17 @@ Unmatched papers are returned separately, sorted by best semantic score,
 so nothing is truly lost — they appear at the bottom as "misc".
 """
 
+import importlib.util
 import re
 from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 from fetcher import Paper
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     id: str
     name: str
@@ -24,7 +27,7 @@ class Topic:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     paper: Paper
     matched_topics: list[str]
@@ -39,9 +42,10 @@ def _normalize(text: str) -> str:
     return text.lower()
 
 
-def _build_patterns(topics: list[Topic]) -> dict[str, list[re.Pattern]]:
+def _build_patterns(topics: list[Topic]) -> dict[str, re.Pattern]:
     """
-    Compile one regex per term per topic.
+    Compile one regex per topic — an alternation of all its terms, so each
+    paper is scanned once per topic instead of once per term.
 
     Single-word terms (e.g. "symbolic", "IIT", "CoT"):
       - matched as exact whole words only — no suffix wildcard.
@@ -53,25 +57,33 @@ def _build_patterns(topics: list[Topic]) -> dict[str, list[re.Pattern]]:
         "test-time training" should still match "test-time trained".
       - interior words matched exactly.
     """
+    return _compile_patterns(tuple(
+        (t.id, tuple(t.terms)) for t in topics if t.enabled
+    ))
+
+
+@lru_cache(maxsize=8)
+def _compile_patterns(
+    topic_terms: tuple[tuple[str, tuple[str, ...]], ...],
+) -> dict[str, re.Pattern]:
+    """
+    Cached body of _build_patterns, keyed on the enabled topics' (id, terms)
+    so the same topic set is only compiled once per process — the main
+    filter_days pass and the backfill pass reuse the first call's patterns.
+    """
     patterns = {}
-    for topic in topics:
-        if not topic.enabled:
-            continue
-        compiled = []
-        for term in topic.terms:
-            escaped = re.escape(term.lower())
-            words   = term.split()
-            if len(words) == 1:
-                # Exact whole-word match only — no stemming for single tokens
-                pattern = re.compile(r'\b' + escaped + r'\b', re.IGNORECASE)
-            else:
-                # Multi-word: allow light suffix on the last word only
-                pattern = re.compile(
-                    r'\b' + escaped + r'(?:ing|ed|s|tion|ations?)?\b',
-                    re.IGNORECASE
-                )
-            compiled.append(pattern)
-        patterns[topic.id] = compiled
+    for topic_id, terms in topic_terms:
+        singles  = [re.escape(t.lower()) for t in terms if len(t.split()) == 1]
+        phrases  = [re.escape(t.lower()) for t in terms if len(t.split()) > 1]
+        branches = []
+        if phrases:
+            # Multi-word: allow light suffix on the last word only
+            branches.append(r'\b(?:' + '|'.join(phrases) + r')(?:ing|ed|s|tion|ations?)?\b')
+        if singles:
+            # Exact whole-word match only — no stemming for single tokens
+            branches.append(r'\b(?:' + '|'.join(singles) + r')\b')
+        if branches:
+            patterns[topic_id] = re.compile('|'.join(branches), re.IGNORECASE)
     return patterns
 
 
@@ -84,13 +96,11 @@ def keyword_match(
     results: dict[str, list[str]] = {}
 
     for paper in papers:
-        haystack = f"{paper.title} {paper.abstract}".lower()
-        matched = []
-        for topic_id, compiled_patterns in patterns.items():
-            for pat in compiled_patterns:
-                if pat.search(haystack):
-                    matched.append(topic_map[topic_id].name)
-                    break
+        # Patterns are IGNORECASE, so the text is searched as-is — no
+        # lowercased copy of every title + abstract.
+        haystack = f"{paper.title} {paper.abstract}"
+        matched = [topic_map[topic_id].name
+                   for topic_id, pat in patterns.items() if pat.search(haystack)]
         if matched:
             results[paper.id] = matched
 
@@ -99,6 +109,40 @@ def keyword_match(
 
 # ─── Layer 2: Semantic Embedding Matching ───────────────────────────────────
 
+_MODEL     = "all-MiniLM-L6-v2"   # same model terms.py uses for KeyBERT
+_BATCH_CPU = 64
+_BATCH_GPU = 256                  # larger batches keep a GPU busy; CPU gains nothing
+
+
+@lru_cache(maxsize=1)
+def _get_model(name: str = _MODEL):
+    """
+    Load the sentence-transformer once per process. A normal run calls
+    filter_days twice — the new days, then the backfill check — and
+    _encode_topics needs the model as well; all of them share one copy of
+    the weights rather than reloading it per call.
+    """
+    from sentence_transformers import SentenceTransformer
+    print(f"[filter] Loading embedding model {name}…")
+    return SentenceTransformer(name)
+
+
+def _batch_size(model) -> int:
+    return _BATCH_GPU if model.device.type == "cuda" else _BATCH_CPU
+
+
+@lru_cache(maxsize=8)
+def _encode_topics(topic_texts: tuple[str, ...]):
+    """
+    Topic descriptions are fixed for a run, so encode them once and reuse the
+    matrix across every semantic pass (main filter, backfill check).
+    """
+    model = _get_model()
+    return model.encode(list(topic_texts), batch_size=_batch_size(model),
+                        convert_to_numpy=True, normalize_embeddings=True,
+                        show_progress_bar=False)
+
+
 def semantic_score_all(
     papers: list[Paper],
     topics: list[Topic],
@@ -112,144 +156,222 @@ def semantic_score_all(
       matched:   paper_id → {topic_name: score}  for papers >= threshold
       all_best:  paper_id → best_score            for ALL candidates (inc. below threshold)
     """
-    try:
-        from sentence_transformers import SentenceTransformer
-        import numpy as np
-    except ImportError:
-        print("[filter] sentence-transformers not installed, skipping semantic layer.")
-        return {}, {}
-
     already_matched_ids = already_matched_ids or set()
+    candidates = [p for p in papers if p.id not in already_matched_ids]
+    rows, best = _score_candidates(candidates, topics, threshold)
+
+    matched  = {}
+    all_best = {}
+    for i, p in enumerate(candidates):
+        if i in rows:
+            matched[p.id] = rows[i]
+        else:
+            matched.pop(p.id, None)   # duplicate id: last copy wins, as in _assemble
+        all_best[p.id] = best[i]
+    return matched, all_best
+
+
+def _score_candidates(
+    candidates: list[Paper],
+    topics: list[Topic],
+    threshold: float,
+) -> tuple[dict[int, dict[str, float]], list[float]]:
+    """
+    Positional core of semantic_score_all: candidate index → {topic_name: score}
+    for rows >= threshold, plus every row's best score. Keyed by position, not
+    paper ID, so callers scoring several days at once can't mix up two copies
+    of the same ID.
+    """
+    # Nothing to score against, or nothing left to score — don't import or
+    # load the transformer at all.
     enabled_topics = [t for t in topics if t.enabled]
+    if not enabled_topics or not candidates:
+        return {}, [0.0] * len(candidates)
 
-    candidates = [p for p in papers if p.id not in already_matched_ids]
-    if not candidates:
-        return {}, {}
+    # Probe only — _get_model does the real (slow) import on first use.
+    if importlib.util.find_spec("sentence_transformers") is None:
+        print("[filter] sentence-transformers not installed, skipping semantic layer.")
+        return {}, [0.0] * len(candidates)
+    import numpy as np
 
     print(f"[filter] Running semantic scoring on {len(candidates)} papers...")
-    model = SentenceTransformer("all-MiniLM-L6-v2")
+    model      = _get_model()
+    batch_size = _batch_size(model)
+
+    # normalize_embeddings=True makes the dot product below a cosine similarity.
+    # Paper embeddings persist across runs — only unseen texts are encoded.
+    from embedding_cache import encode_cached
+    # Full abstract: the tokenizer truncates at model.max_seq_length (256
+    # tokens, ~1000 chars), so a character slice only cut signal early.
+    paper_texts      = [f"{p.title}. {p.abstract}" for p in candidates]
+    paper_embeddings = encode_cached(
+        paper_texts, _MODEL,
+        lambda texts: model.encode(texts, batch_size=batch_size, convert_to_numpy=True,
+                                   normalize_embeddings=True, show_progress_bar=False),
+    )
 
-    paper_texts     = [f"{p.title}. {p.abstract[:512]}" for p in candidates]
-    paper_embeddings = model.encode(paper_texts, batch_size=64, show_progress_bar=False)
+    topic_embeddings = _encode_topics(tuple(t.description for t in enabled_topics))
 
-    topic_texts      = [t.description for t in enabled_topics]
-    topic_embeddings = model.encode(topic_texts, show_progress_bar=False)
+    similarity = paper_embeddings @ topic_embeddings.T  # (n_papers, n_topics)
 
-    from numpy.linalg import norm
-    paper_norms = paper_embeddings / (norm(paper_embeddings, axis=1, keepdims=True) + 1e-9)
-    topic_norms = topic_embeddings / (norm(topic_embeddings, axis=1, keepdims=True) + 1e-9)
-    similarity  = paper_norms @ topic_norms.T  # (n_papers, n_topics)
+    # Threshold + best-score in numpy; Python only touches above-threshold cells.
+    # float64 before rounding so .tolist() yields clean 3-decimal floats.
+    scores      = similarity.astype(np.float64).round(3)
+    above, cols = np.nonzero(scores >= threshold)
+    names       = [t.name for t in enabled_topics]
 
-    matched:  dict[str, dict[str, float]] = {}
-    all_best: dict[str, float]            = {}
+    rows: dict[int, dict[str, float]] = {}
+    for i, j, score in zip(above.tolist(), cols.tolist(), scores[above, cols].tolist()):
+        rows.setdefault(i, {})[names[j]] = score
 
-    for i, paper in enumerate(candidates):
-        scores = {
-            topic.name: round(float(similarity[i, j]), 3)
-            for j, topic in enumerate(enabled_topics)
-        }
-        best = max(scores.values()) if scores else 0.0
-        all_best[paper.id] = best
+    return rows, scores.max(axis=1).tolist()
 
-        above = {t: s for t, s in scores.items() if s >= threshold}
-        if above:
-            matched[paper.id] = above
 
-    return matched, all_best
+# ─── Combined Filter ─────────────────────────────────────────────────────────
 
+def _rank(r: MatchResult) -> tuple:
+    """
+    Sort key — lower tuple = higher rank (sort ascending, then reverse).
+    Tier 0: keyword + semantic match (most confident)
+    Tier 1: keyword-only (exact term hit — precise but no score)
+    Tier 2: semantic-only (ranked by score descending)
+    Within each tier: best_score descending (keyword gets synthetic 1.0)
+    """
+    tier = 0 if r.match_method == "both" else \
+           1 if r.match_method == "keyword" else 2
+    score = r.best_semantic_score if r.match_method != "keyword" else 1.0
+    return (tier, -score)
 
-# ─── Combined Filter ─────────────────────────────────────────────────────────
 
-def filter_papers(
+def _assemble(
     papers: list[Paper],
-    topics: list[Topic],
-    embedding_threshold: float = 0.35,
-    seen_ids: Optional[set] = None,
+    keyword_results: dict[str, list[str]],
+    semantic_results: dict[str, dict[str, float]],
+    all_best_scores: dict[str, float],
 ) -> tuple[list[MatchResult], list[MatchResult]]:
     """
-    Returns (matched, unmatched).
-
-    matched:   papers that passed keyword or semantic threshold, sorted by date desc.
-    unmatched: everything else, sorted by best semantic score desc
-               (closest-to-relevant first) — rendered as "irrelevant" safety net.
+    Build ranked (matched, unmatched) MatchResults for one batch of papers.
+    One pass in batch order, so ties in the ranking keep the fetch order.
     """
-    seen_ids = seen_ids or set()
-
-    fresh_papers = [p for p in papers if p.id not in seen_ids]
-    print(f"[filter] {len(fresh_papers)} fresh papers.")
-
-    if not fresh_papers:
-        return [], []
-
-    # Layer 1: keyword
-    keyword_results = keyword_match(fresh_papers, topics)
-    print(f"[filter] Keyword layer matched {len(keyword_results)} papers.")
-
-    # Layer 2: semantic — scores ALL non-keyword papers, not just above threshold
-    semantic_results, all_best_scores = semantic_score_all(
-        fresh_papers,
-        topics,
-        threshold=embedding_threshold,
-        already_matched_ids=set(keyword_results.keys()),
-    )
-    print(f"[filter] Semantic layer matched {len(semantic_results)} additional papers.")
-
-    paper_map   = {p.id: p for p in fresh_papers}
-    matched_ids = set(keyword_results) | set(semantic_results)
-
-    # ── Matched results ──
-    matched = []
-    for pid in matched_ids:
-        paper  = paper_map[pid]
-        in_kw  = pid in keyword_results
-        in_sem = pid in semantic_results
+    matched, unmatched = [], []
+    for paper in {p.id: p for p in papers}.values():
+        pid = paper.id
+        kw  = keyword_results.get(pid)
+        sem = semantic_results.get(pid)
+
+        if kw is None and sem is None:
+            # ── Unmatched — sorted by semantic proximity below ──
+            unmatched.append(MatchResult(
+                paper=paper,
+                matched_topics=[],
+                match_method="none",
+                semantic_scores={},
+                best_semantic_score=all_best_scores.get(pid, 0.0),
+            ))
+            continue
 
-        if in_kw and in_sem:
+        if kw is not None and sem is not None:
             method         = "both"
-            topics_matched = list(set(keyword_results[pid]) | set(semantic_results[pid].keys()))
-        elif in_kw:
+            topics_matched = list(dict.fromkeys([*kw, *sem]))
+        elif kw is not None:
             method         = "keyword"
-            topics_matched = keyword_results[pid]
+            topics_matched = kw
         else:
             method         = "semantic"
-            topics_matched = list(semantic_results[pid].keys())
+            topics_matched = list(sem)
 
         matched.append(MatchResult(
             paper=paper,
             matched_topics=topics_matched,
             match_method=method,
-            semantic_scores=semantic_results.get(pid, {}),
+            semantic_scores=sem or {},
             best_semantic_score=all_best_scores.get(pid, 0.0),
         ))
 
-    def _rank(r: MatchResult) -> tuple:
-        """
-        Sort key — lower tuple = higher rank (sort ascending, then reverse).
-        Tier 0: keyword + semantic match (most confident)
-        Tier 1: keyword-only (exact term hit — precise but no score)
-        Tier 2: semantic-only (ranked by score descending)
-        Within each tier: best_score descending (keyword gets synthetic 1.0)
-        """
-        tier = 0 if r.match_method == "both" else \
-               1 if r.match_method == "keyword" else 2
-        score = r.best_semantic_score if r.match_method != "keyword" else 1.0
-        return (tier, -score)
-
     matched.sort(key=_rank)
+    unmatched.sort(key=lambda r: r.best_semantic_score, reverse=True)
+    return matched, unmatched
 
-    # ── Unmatched results — sorted by semantic proximity ──
-    unmatched = []
-    for pid, paper in paper_map.items():
-        if pid not in matched_ids:
-            unmatched.append(MatchResult(
-                paper=paper,
-                matched_topics=[],
-                match_method="none",
-                semantic_scores={},
-                best_semantic_score=all_best_scores.get(pid, 0.0),
-            ))
 
-    unmatched.sort(key=lambda r: r.best_semantic_score, reverse=True)
+def _filter_batches(
+    batches: list[list[Paper]],
+    topics: list[Topic],
+    embedding_threshold: float,
+) -> list[tuple[list[MatchResult], list[MatchResult]]]:
+    """
+    Run both layers over several batches (days), sharing one embedding pass
+    so the model encodes every candidate in one call instead of once per day.
+
+    Results are kept per batch: the same paper ID can sit in two days' files
+    (v1 stored on one day, a revision on a later one), and each copy must be
+    judged on its own text — exactly as filter_papers would on that day alone.
+    """
+    if not any(batches):
+        return [([], []) for _ in batches]
+
+    # Layer 1: keyword, per batch
+    keyword_results = [keyword_match(batch, topics) for batch in batches]
+    print(f"[filter] Keyword layer matched {sum(map(len, keyword_results))} papers.")
+
+    # Layer 2: semantic — scores ALL non-keyword papers, not just above threshold.
+    # Candidates from every batch go through one encode; (batch, paper) pairs
+    # carry each row back to its own batch.
+    candidates = [(b, p) for b, batch in enumerate(batches)
+                  for p in batch if p.id not in keyword_results[b]]
+    rows, best = _score_candidates([p for _, p in candidates], topics, embedding_threshold)
+    print(f"[filter] Semantic layer matched {len(rows)} additional papers.")
+
+    semantic_results = [{} for _ in batches]
+    all_best_scores  = [{} for _ in batches]
+    for i, (b, p) in enumerate(candidates):
+        if i in rows:
+            semantic_results[b][p.id] = rows[i]
+        else:
+            semantic_results[b].pop(p.id, None)   # duplicate id: last copy wins
+        all_best_scores[b][p.id] = best[i]
+
+    return [_assemble(batch, keyword_results[b], semantic_results[b], all_best_scores[b])
+            for b, batch in enumerate(batches)]
+
 
+def filter_papers(
+    papers: list[Paper],
+    topics: list[Topic],
+    embedding_threshold: float = 0.35,
+    seen_ids: Optional[set] = None,
+) -> tuple[list[MatchResult], list[MatchResult]]:
+    """
+    Returns (matched, unmatched).
+
+    matched:   papers that passed keyword or semantic threshold, sorted by date desc.
+    unmatched: everything else, sorted by best semantic score desc
+               (closest-to-relevant first) — rendered as "irrelevant" safety net.
+    """
+    seen_ids = seen_ids or frozenset()
+
+    fresh_papers = [p for p in papers if p.id not in seen_ids]
+    print(f"[filter] {len(fresh_papers)} fresh papers.")
+
+    if not fresh_papers:
+        return [], []
+
+    matched, unmatched = _filter_batches([fresh_papers], topics, embedding_threshold)[0]
     print(f"[filter] {len(matched)} matched, {len(unmatched)} unmatched.")
-    return matched, unmatched
\ No newline at end of file
+    return matched, unmatched
+
+
+def filter_days(
+    papers_by_day: dict[date, list[Paper]],
+    topics: list[Topic],
+    embedding_threshold: float = 0.35,
+) -> dict[date, tuple[list[MatchResult], list[MatchResult]]]:
+    """
+    filter_papers for several days in one pass — same per-day (matched,
+    unmatched) output, but the semantic layer encodes all days' papers in a
+    single batched call. Keys keep the input order.
+    """
+    days = list(papers_by_day)
+    print(f"[filter] {sum(len(papers_by_day[d]) for d in days)} papers "
+          f"across {len(days)} day(s).")
+    results = _filter_batches([papers_by_day[d] for d in days], topics, embedding_threshold)
+    return dict(zip(days, results))
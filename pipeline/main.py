@@ -23,28 +23,43 @@ ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(Path(__file__).parent))
 
 from fetcher   import fetch_recent_days
-from filter    import filter_papers, Topic
+from filter    import filter_days, Topic
 from storage   import (save_papers, date_has_data, list_available_dates,
                        load_papers, load_existing_ids, patch_papers,
                        load_matched_summaries, update_available_dates,
-                       prune_old_files)
+                       prune_old_files, RETENTION_DAYS)
 from notifier  import send_digest, DaySummary, PaperSummary
-from terms     import load_or_generate, regenerate as regenerate_terms
+from terms     import load_or_generate, regenerate as regenerate_terms, YamlLoader
 
 CONFIG_PATH = ROOT / "config.yaml"
 UTC         = timezone.utc
 MAX_TABS    = 7
 
+# Single source of truth for optional config.yaml keys — load_config() fills
+# these in, so the rest of the pipeline can index config[...] directly.
+DEFAULT_CONFIG = {
+    "categories":          ["cs.AI", "cs.LG", "cs.CL"],
+    "max_results":         2000,
+    "embedding_threshold": 0.35,
+    "email_enabled":       True,
+    "retention_days":      RETENTION_DAYS,
+}
+
 
 def load_config() -> dict:
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return {**DEFAULT_CONFIG, **(yaml.load(f, Loader=YamlLoader) or {})}
+
+
+def topic_id_for(name: str) -> str:
+    """Topic ID used for data/terms/{id}.yaml — derived from the display name."""
+    return name.lower().replace(" ", "-")
 
 
 def build_topics(config: dict) -> list[Topic]:
     topics = []
     for t in config["topics"]:
-        topic_id = t["name"].lower().replace(" ", "-")
+        topic_id = topic_id_for(t["name"])
         terms    = load_or_generate(
             topic_id    = topic_id,
             name        = t["name"],
@@ -60,30 +75,36 @@ def build_topics(config: dict) -> list[Topic]:
     return topics
 
 
-def filter_and_save(day: date, papers: list, topics: list[Topic], config: dict) -> DaySummary:
-    """Run filter on a day's papers, save results, return a DaySummary for notification."""
-    matched, unmatched = filter_papers(
-        papers=papers,
-        topics=topics,
-        embedding_threshold=config.get("embedding_threshold", 0.35),
-        seen_ids=set(),
-    )
-    print(f"[main] {day}: {len(matched)} matched, {len(unmatched)} unmatched.")
-    save_papers(ROOT, day, matched, unmatched)
-
-    paper_summaries = [
-        PaperSummary(
-            title          = r.paper.title,
-            url            = r.paper.url,
-            authors        = r.paper.authors,
-            abstract       = r.paper.abstract,
-            matched_topics = r.matched_topics,
-            backfilled     = False,
-        )
-        for r in matched
-    ]
-    return DaySummary(day=day, matched=paper_summaries,
-                      total=len(matched) + len(unmatched))
+def filter_and_save(papers_by_day: dict[date, list], topics: list[Topic],
+                    config: dict) -> list[DaySummary]:
+    """
+    Filter several days' papers in one batched pass, save each day's results,
+    and return a DaySummary per day for notification.
+    """
+    if not papers_by_day:
+        return []
+
+    results   = filter_days(papers_by_day, topics,
+                            embedding_threshold=config["embedding_threshold"])
+    summaries = []
+    for day, (matched, unmatched) in results.items():
+        print(f"[main] {day}: {len(matched)} matched, {len(unmatched)} unmatched.")
+        save_papers(ROOT, day, matched, unmatched)
+
+        paper_summaries = [
+            PaperSummary(
+                title          = r.paper.title,
+                url            = r.paper.url,
+                authors        = r.paper.authors,
+                abstract       = r.paper.abstract,
+                matched_topics = r.matched_topics,
+                backfilled     = False,
+            )
+            for r in matched
+        ]
+        summaries.append(DaySummary(day=day, matched=paper_summaries,
+                                    total=len(matched) + len(unmatched)))
+    return summaries
 
 
 BACKFILL_DAYS = 2   # how many already-stored days to check for late arrivals
@@ -105,6 +126,7 @@ def backfill_and_patch(
     """
     backfill_summaries = []
     check_days = stored[:BACKFILL_DAYS]
+    new_by_day = {}
 
     for day in check_days:
         fetched = papers_by_date.get(day, [])
@@ -118,13 +140,17 @@ def backfill_and_patch(
             print(f"[main] Backfill {day}: no new papers found.")
             continue
 
-        print(f"\n[main] Backfill {day}: {len(new_papers)} new paper(s) found — filtering…")
-        matched, unmatched = filter_papers(
-            papers              = new_papers,
-            topics              = enabled,
-            embedding_threshold = config.get("embedding_threshold", 0.35),
-            seen_ids            = set(),
-        )
+        print(f"[main] Backfill {day}: {len(new_papers)} new paper(s) found.")
+        new_by_day[day] = new_papers
+
+    if not new_by_day:
+        return backfill_summaries
+
+    print(f"\n[main] Filtering backfills for {len(new_by_day)} day(s)…")
+    results = filter_days(new_by_day, enabled,
+                          embedding_threshold=config["embedding_threshold"])
+
+    for day, (matched, unmatched) in results.items():
         print(f"[main] Backfill {day}: {len(matched)} matched, {len(unmatched)} unmatched.")
         patch_papers(ROOT, day, matched, unmatched)
 
@@ -170,7 +196,7 @@ def run_normal(config: dict, enabled: list[Topic], cats: list[str], max_res: int
         print("[main] Nothing to fetch.")
         return []
 
-    oldest    = min(all_days_needed)
+    oldest    = all_days_needed[0]   # sorted ascending above
     num_days  = (today - oldest).days + 1
     print(f"[main] Fetching {num_days} days "
           f"({oldest} → {today}, covers {len(missing)} missing + "
@@ -179,14 +205,15 @@ def run_normal(config: dict, enabled: list[Topic], cats: list[str], max_res: int
                                        num_days=num_days)
 
     # ── Process missing days ──────────────────────────────────────────────────
-    summaries = []
+    to_filter = {}
     for day in sorted(missing, reverse=True):
         papers = papers_by_date.get(day, [])
         if papers:
-            print(f"\n[main] Filtering {day} ({len(papers)} papers)…")
-            summaries.append(filter_and_save(day, papers, enabled, config))
+            print(f"[main] {day}: {len(papers)} papers to filter.")
+            to_filter[day] = papers
         else:
             print(f"[main] {day}: no papers found (weekend or holiday?).")
+    summaries = filter_and_save(to_filter, enabled, config)
 
     # ── Backfill check on already-stored days ─────────────────────────────────
     backfill_summaries = backfill_and_patch(
@@ -208,15 +235,14 @@ def run_refilter(config: dict, enabled: list[Topic]) -> list[DaySummary]:
         return []
 
     print(f"[main] Refiltering {len(stored)} stored date(s)…")
-    summaries = []
+    to_filter = {}
     for day in stored:
         papers = load_papers(ROOT, day)
         if papers is None:
             print(f"[main] {day}: file missing, skipping.")
             continue
-        print(f"\n[main] Refiltering {day} ({len(papers)} papers)…")
-        summaries.append(filter_and_save(day, papers, enabled, config))
-    return summaries
+        to_filter[day] = papers
+    return filter_and_save(to_filter, enabled, config)
 
 
 def run_refetch(config: dict, enabled: list[Topic], cats: list[str], max_res: int) -> list[DaySummary]:
@@ -227,7 +253,7 @@ def run_refetch(config: dict, enabled: list[Topic], cats: list[str], max_res: in
     """
     stored           = list_available_dates(ROOT)
     today            = datetime.now(UTC).date()
-    retention_days   = config.get("retention_days", 90)
+    retention_days   = config["retention_days"]
 
     tab_days    = [today - timedelta(days=i) for i in range(MAX_TABS)]
     target_days = sorted(set(stored) | set(tab_days), reverse=True)
@@ -243,15 +269,15 @@ def run_refetch(config: dict, enabled: list[Topic], cats: list[str], max_res: in
           f"({target_days[-1]} → {target_days[0]})…")
     papers_by_date = fetch_recent_days(categories=cats, max_results=max_res,
                                        num_days=num_days)
-    summaries = []
+    to_filter = {}
     for day in target_days:
         papers = papers_by_date.get(day, [])
         if papers:
-            print(f"\n[main] Filtering {day} ({len(papers)} papers)…")
-            summaries.append(filter_and_save(day, papers, enabled, config))
+            print(f"[main] {day}: {len(papers)} papers to filter.")
+            to_filter[day] = papers
         else:
             print(f"[main] {day}: no papers from arXiv (weekend/holiday?).")
-    return summaries
+    return filter_and_save(to_filter, enabled, config)
 
 
 def run_notify_only() -> list:
@@ -339,13 +365,13 @@ def main():
         print("[main] Regenerating all term files with KeyBERT…")
         for t in config["topics"]:
             if t.get("enabled", True):
-                tid = t["name"].lower().replace(" ", "-")
+                tid = topic_id_for(t["name"])
                 regenerate_terms(tid, t["name"], t["description"])
 
     topics  = build_topics(config)
     enabled = [t for t in topics if t.enabled]
-    cats    = config.get("categories", ["cs.AI", "cs.LG", "cs.CL"])
-    max_res = config.get("max_results", 2000)
+    cats    = config["categories"]
+    max_res = config["max_results"]
     print(f"[main] Topics: {[t.name for t in enabled]}")
 
     if mode == "notify-only":
@@ -359,10 +385,10 @@ def main():
 
     if mode != "notify-only":
         update_available_dates(ROOT)
-        prune_old_files(ROOT, retention_days=config.get("retention_days", 90))
+        prune_old_files(ROOT, retention_days=config["retention_days"])
 
     # ── Notify ────────────────────────────────────────────────────────────────
-    if do_notify and config.get("email_enabled", True):
+    if do_notify and config["email_enabled"]:
         site_url = config.get("site_url")   # optional in config.yaml
         send_digest(summaries, site_url=site_url)
 
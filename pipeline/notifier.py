@@ -80,57 +80,85 @@ def _clip(text: str, limit: int = 240) -> str:
     return text[:limit].rsplit(" ", 1)[0] + "…" if len(text) > limit else text
 
 
+def _authors_str(authors: list[str]) -> str:
+    if len(authors) > 3:
+        return f"{authors[0]}, {authors[1]}, {authors[2]} et al."
+    return ", ".join(authors)
+
+
+# ── Static HTML blocks ────────────────────────────────────────────────────────
+# Plain strings, not f-strings — these never change between digests.
+
+_EMPTY_HTML = """
+        <div style="text-align:center;padding:48px 24px;color:#94a3b8;">
+          <div style="font-size:32px;margin-bottom:12px;">📭</div>
+          <div style="font-size:16px;font-weight:600;color:#475569;">
+            No matched papers today
+          </div>
+          <div style="font-size:13px;margin-top:6px;">
+            The pipeline ran successfully — nothing matched your topics.
+          </div>
+        </div>"""
+
+_FOOTER_HTML = """<div style="text-align:center;margin-top:36px;font-size:11px;color:#cbd5e1;">
+      arXiv Digest &nbsp;·&nbsp; automated daily digest &nbsp;·&nbsp;
+      papers sourced from
+      <a href="https://arxiv.org" style="color:#94a3b8;text-decoration:none;">
+        arxiv.org
+      </a>
+    </div>"""
+
+# One per paper — filled with str.format (values pre-escaped by the caller).
+_CARD_HTML = """
+                <div style="background:#ffffff;border:1px solid #e2e8f0;
+                            border-left:4px solid {accent};border-radius:8px;
+                            padding:16px 20px;margin-bottom:0.7em;">
+                  <a href="{url}"
+                     style="font-size:15px;font-weight:700;color:#0f172a;
+                            text-decoration:none;line-height:1.4;display:block;
+                            margin-bottom:5px;">{title}</a>
+                  <div style="font-size:12px;color:#94a3b8;margin-bottom:10px;">
+                    {authors}
+                  </div>
+                  <div style="font-size:13px;color:#475569;line-height:1.65;">
+                    {abstract}
+                  </div>
+                </div>"""
+
+
 # ── HTML builder ──────────────────────────────────────────────────────────────
 
 def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
     days_with_matches = [s for s in summaries if s.matched]
 
-    all_topics: list[str] = []
-    seen_t: set[str] = set()
-    for s in days_with_matches:
-        for p in s.matched:
-            for t in p.matched_topics:
-                if t not in seen_t:
-                    all_topics.append(t)
-                    seen_t.add(t)
+    # Unique topics in order of first appearance
+    all_topics = list(dict.fromkeys(
+        t for s in days_with_matches for p in s.matched for t in p.matched_topics
+    ))
     colors = _topic_colors(all_topics)
 
     e = html_lib.escape
 
-    day_html = ""
+    day_parts: list[str] = []
     for summary in days_with_matches:
         by_topic: dict[str, list[PaperSummary]] = defaultdict(list)
         for p in summary.matched:
             for t in p.matched_topics:
                 by_topic[t].append(p)
 
-        topic_sections = ""
+        topic_sections: list[str] = []
         for topic, papers in by_topic.items():
             bg, fg = colors.get(topic, ("#f1f5f9", "#475569"))
 
             shown    = papers[:5]
             overflow = len(papers) - len(shown)
 
-            paper_cards = ""
+            paper_cards: list[str] = []
             for p in shown:
-                authors_str = ", ".join(p.authors[:3])
-                if len(p.authors) > 3:
-                    authors_str += " et al."
-                paper_cards += f"""
-                <div style="background:#ffffff;border:1px solid #e2e8f0;
-                            border-left:4px solid {fg};border-radius:8px;
-                            padding:16px 20px;margin-bottom:0.7em;">
-                  <a href="{e(p.url)}"
-                     style="font-size:15px;font-weight:700;color:#0f172a;
-                            text-decoration:none;line-height:1.4;display:block;
-                            margin-bottom:5px;">{e(p.title)}</a>
-                  <div style="font-size:12px;color:#94a3b8;margin-bottom:10px;">
-                    {e(authors_str)}
-                  </div>
-                  <div style="font-size:13px;color:#475569;line-height:1.65;">
-                    {e(_clip(p.abstract))}
-                  </div>
-                </div>"""
+                paper_cards.append(_CARD_HTML.format(
+                    accent=fg, url=e(p.url), title=e(p.title),
+                    authors=e(_authors_str(p.authors)), abstract=e(_clip(p.abstract)),
+                ))
 
             overflow_note = ""
             if overflow > 0:
@@ -143,7 +171,7 @@ def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
                   +{overflow} more paper{'s' if overflow != 1 else ''}{link}
                 </div>"""
 
-            topic_sections += f"""
+            topic_sections.append(f"""
             <div style="margin-bottom:28px;">
               <div style="margin-bottom:12px;">
                 <span style="background:{bg};color:{fg};border:1.5px solid {fg};
@@ -153,9 +181,9 @@ def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
                   {len(papers)} paper{'s' if len(papers) != 1 else ''}
                 </span>
               </div>
-              {paper_cards}
+              {"".join(paper_cards)}
               {overflow_note}
-            </div>"""
+            </div>""")
 
         late_banner = ""
         if summary.backfill_count > 0:
@@ -167,7 +195,7 @@ def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
             paper{'s' if n != 1 else ''} missed on the original run and added retroactively.
           </div>"""
 
-        day_html += f"""
+        day_parts.append(f"""
         <div style="margin-bottom:40px;padding-top:1em;">
           <div style="border-bottom:2px solid #e2e8f0;padding-bottom:12px;
                       margin-bottom:22px;">
@@ -184,20 +212,12 @@ def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
             </div>
           </div>
           {late_banner}
-          {topic_sections}
-        </div>"""
+          {"".join(topic_sections)}
+        </div>""")
 
+    day_html = "".join(day_parts)
     if not days_with_matches:
-        day_html = """
-        <div style="text-align:center;padding:48px 24px;color:#94a3b8;">
-          <div style="font-size:32px;margin-bottom:12px;">📭</div>
-          <div style="font-size:16px;font-weight:600;color:#475569;">
-            No matched papers today
-          </div>
-          <div style="font-size:13px;margin-top:6px;">
-            The pipeline ran successfully — nothing matched your topics.
-          </div>
-        </div>"""
+        day_html = _EMPTY_HTML
 
     cta = ""
     if site_url:
@@ -223,13 +243,7 @@ def _build_html(summaries: list[DaySummary], site_url: str | None) -> str:
   <div style="max-width:620px;margin:1em auto;padding:0 16px 48px;">
     {day_html}
     {cta}
-    <div style="text-align:center;margin-top:36px;font-size:11px;color:#cbd5e1;">
-      arXiv Digest &nbsp;·&nbsp; automated daily digest &nbsp;·&nbsp;
-      papers sourced from
-      <a href="https://arxiv.org" style="color:#94a3b8;text-decoration:none;">
-        arxiv.org
-      </a>
-    </div>
+    {_FOOTER_HTML}
   </div>
 </body>
 </html>"""
@@ -257,11 +271,8 @@ def _build_plaintext(summaries: list[DaySummary], site_url: str | None) -> str:
         for topic, papers in by_topic.items():
             lines.append(f"\n  ▸ {topic}  ({len(papers)} paper{'s' if len(papers)!=1 else ''})\n")
             for p in papers:
-                authors_str = ", ".join(p.authors[:3])
-                if len(p.authors) > 3:
-                    authors_str += " et al."
                 lines += [f"  • {p.title}",
-                          f"    {authors_str}",
+                          f"    {_authors_str(p.authors)}",
                           f"    {_clip(p.abstract, 200)}",
                           f"    {p.url}", ""]
 
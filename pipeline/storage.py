@@ -35,32 +35,93 @@ data/available_dates.json:
 """
 
 import json
+import os
 from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
 
 from fetcher import Paper
 from filter  import MatchResult
 
+try:
+    import orjson   # optional — several times faster on abstract-heavy payloads
+except ImportError:
+    orjson = None
+
 RETENTION_DAYS = 90
 KST = timezone(timedelta(hours=9))  # kept for fetched_at display only
 UTC = timezone.utc
 
 
 def _papers_dir(root: Path) -> Path:
-    d = root / "data" / "papers"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return root / "data" / "papers"
 
 
 def _path_for_date(root: Path, d: date) -> Path:
-    p = _papers_dir(root) / str(d.year) / f"{d.month:02d}" / f"{d.day:02d}.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    return p
+    return _papers_dir(root) / str(d.year) / f"{d.month:02d}" / f"{d.day:02d}.json"
+
+
+def _date_files(root: Path) -> list[tuple[date, str]]:
+    """
+    (date, path) for every data/papers/YYYY/MM/DD.json. Walks the three
+    levels with os.scandir — no Path object or glob match per file.
+    """
+    found = []
+    try:
+        years = list(os.scandir(_papers_dir(root)))
+    except FileNotFoundError:
+        return found
+    for y in years:
+        if not y.is_dir():
+            continue
+        for m in os.scandir(y.path):
+            if not m.is_dir():
+                continue
+            for f in os.scandir(m.path):
+                if len(f.name) != 7 or not f.name.endswith(".json"):
+                    continue
+                try:
+                    found.append((date(int(y.name), int(m.name), int(f.name[:2])), f.path))
+                except ValueError:
+                    pass
+    return found
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(d: Path) -> None:
+    """
+    mkdir once per directory per process, and only on the write path —
+    lookups (date_has_data, load_*) no longer create directories as a
+    side effect. prune_old_files clears this cache when it removes dirs.
+    """
+    d.mkdir(parents=True, exist_ok=True)
 
 
 # ── Serialise ─────────────────────────────────────────────────────────────────
 
+def _read_json(path: Path) -> dict:
+    """Parse a stored JSON file; orjson reads the raw bytes without a decode pass."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path: Path, payload: dict, pretty: bool = False) -> None:
+    """
+    Write payload as UTF-8 JSON — compact by default, since day files are
+    only machine-read; pretty=True indents by 2. orjson encodes straight to
+    bytes; the stdlib fallback produces the same text.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+    elif pretty:
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                        encoding="utf-8")
+
+
 def _paper_to_dict(p: Paper, match: MatchResult | None) -> dict:
     return {
         "id":             p.id,
@@ -73,19 +134,22 @@ def _paper_to_dict(p: Paper, match: MatchResult | None) -> dict:
         "categories":     p.categories,
         "matched_topics": match.matched_topics if match else [],
         "match_method":   match.match_method   if match else "none",
-        "best_score":     round(match.best_semantic_score, 3) if match else 0.0,
+        "best_score":     match.best_semantic_score if match else 0.0,   # already 3 dp
     }
 
 
 def _dict_to_paper(d: dict) -> Paper:
+    published = datetime.fromisoformat(d["published"])
+    updated   = d.get("updated", d["published"])   # fallback for old files
     return Paper(
         id=d["id"],
         title=d["title"],
         abstract=d["abstract"],
         authors=d["authors"],
         url=d["url"],
-        published=datetime.fromisoformat(d["published"]),
-        updated=datetime.fromisoformat(d.get("updated", d["published"])),  # fallback for old files
+        published=published,
+        # Unrevised (v1) papers have updated == published — reuse the parse
+        updated=published if updated == d["published"] else datetime.fromisoformat(updated),
         categories=d["categories"],
     )
 
@@ -97,12 +161,15 @@ def save_papers(
     d: date,
     matched: list[MatchResult],
     unmatched: list[MatchResult],
+    pretty: bool = False,
 ) -> None:
     """
     Save matched + unmatched MatchResults for a given date.
     matched_topics and best_score are embedded directly in each paper record.
+    pretty=True writes indented JSON for reading by hand; default is compact.
     """
     path = _path_for_date(root, d)
+    _ensure_dir(path.parent)
 
     # All papers: matched first, then unmatched — each carries its own MatchResult
     all_results = matched + unmatched
@@ -113,7 +180,7 @@ def save_papers(
         "fetched_at": datetime.now(KST).isoformat(),
         "papers":     papers_json,
     }
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(path, payload, pretty=pretty)
     print(f"[storage] Saved {len(matched)} matched + {len(unmatched)} unmatched → {path.name}")
 
 
@@ -125,7 +192,7 @@ def load_papers(root: Path, d: date) -> list[Paper] | None:
     path = _path_for_date(root, d)
     if not path.exists():
         return None
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _read_json(path)
     papers  = [_dict_to_paper(p) for p in payload["papers"]]
     print(f"[storage] Loaded {len(papers)} papers ← {path.name}")
     return papers
@@ -142,7 +209,7 @@ def load_matched_summaries(root: Path, d: date):
     path = _path_for_date(root, d)
     if not path.exists():
         return None
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _read_json(path)
     papers  = payload["papers"]
 
     matched = [
@@ -168,7 +235,7 @@ def load_existing_ids(root: Path, d: date) -> set[str]:
     path = _path_for_date(root, d)
     if not path.exists():
         return set()
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _read_json(path)
     return {p["id"] for p in payload.get("papers", [])}
 
 
@@ -177,17 +244,19 @@ def patch_papers(
     d: date,
     new_matched: list[MatchResult],
     new_unmatched: list[MatchResult],
+    pretty: bool = False,
 ) -> None:
     """
     Prepend backfilled papers to an existing day's JSON.
     New matched papers go to the very top; new unmatched appended at the end.
     Each backfilled record gets backfilled=true so the frontend can badge them.
+    pretty is passed through as in save_papers.
     """
     path = _path_for_date(root, d)
     if not path.exists():
         return
 
-    payload      = json.loads(path.read_text(encoding="utf-8"))
+    payload      = _read_json(path)
     existing     = payload["papers"]
 
     def to_dict_backfilled(r: MatchResult) -> dict:
@@ -202,23 +271,14 @@ def patch_papers(
     payload["papers"] = new_matched_dicts + existing + new_unmatched_dicts
     payload["patched_at"] = datetime.now(UTC).isoformat()
 
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(path, payload, pretty=pretty)
     print(f"[storage] Patched {len(new_matched_dicts)} matched + "
           f"{len(new_unmatched_dicts)} unmatched backfills → {path.name}")
 
 
 def list_available_dates(root: Path) -> list[date]:
     """Return all dates that have saved JSON files, sorted newest-first."""
-    dates = []
-    for f in _papers_dir(root).glob("*/*/??.json"):
-        try:
-            day   = int(f.stem)
-            month = int(f.parent.name)
-            year  = int(f.parent.parent.name)
-            dates.append(date(year, month, day))
-        except (ValueError, TypeError):
-            pass
-    return sorted(dates, reverse=True)
+    return sorted((d for d, _ in _date_files(root)), reverse=True)
 
 
 # ── available_dates.json ──────────────────────────────────────────────────────
@@ -252,37 +312,35 @@ def update_available_dates(root: Path) -> None:
     }
 
     out = root / "data" / "available_dates.json"
-    out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(out, payload, pretty=True)   # tiny, and read by hand
     print(f"[storage] Updated available_dates.json ({len(dates)} dates, latest: {dates[0]})")
 
 
 # ── Prune ─────────────────────────────────────────────────────────────────────
 
 def prune_old_files(root: Path, retention_days: int = RETENTION_DAYS) -> None:
-    """Delete paper JSON files older than retention_days."""
+    """
+    Delete paper JSON files older than retention_days in one scan, then drop
+    any month/year directories that pruning left empty. Logs one summary
+    line rather than one per file.
+    """
     cutoff = datetime.now(UTC).date() - timedelta(days=retention_days)
-    papers_dir = _papers_dir(root)
-    pruned = 0
-    for f in papers_dir.glob("*/*/??.json"):
-        try:
-            day   = int(f.stem)
-            month = int(f.parent.name)
-            year  = int(f.parent.parent.name)
-            file_date = date(year, month, day)
-        except (ValueError, TypeError):
-            continue
-        if file_date < cutoff:
-            f.unlink()
-            pruned += 1
-            print(f"[storage] Pruned {f.relative_to(papers_dir)}")
-    # Remove empty month/year directories
-    for month_dir in papers_dir.glob("*/*/"):
-        if month_dir.is_dir() and not any(month_dir.iterdir()):
-            month_dir.rmdir()
-    for year_dir in papers_dir.glob("*/"):
-        if year_dir.is_dir() and not any(year_dir.iterdir()):
-            year_dir.rmdir()
-    if pruned:
-        print(f"[storage] Pruned {pruned} file(s).")
-    else:
-        print(f"[storage] Nothing to prune (retention: {retention_days} days).")
\ No newline at end of file
+    pruned = sorted((d, path) for d, path in _date_files(root) if d < cutoff)
+    if not pruned:
+        print(f"[storage] Nothing to prune (retention: {retention_days} days).")
+        return
+
+    emptied = set()
+    for _, path in pruned:
+        os.unlink(path)
+        emptied.add(os.path.dirname(path))
+    # Month dirs first, then their year dirs; rmdir refuses non-empty ones
+    for month_dir in emptied:
+        for d in (month_dir, os.path.dirname(month_dir)):
+            try:
+                os.rmdir(d)
+            except OSError:
+                break
+    _ensure_dir.cache_clear()
+    print(f"[storage] Pruned {len(pruned)} file(s) "
+          f"({pruned[0][0]} → {pruned[-1][0]}, older than {cutoff}).")
@@ -23,6 +23,13 @@ import yaml
 from datetime import datetime, timezone
 from pathlib import Path
 
+# libyaml's C parser when PyYAML was built with it; pure-Python otherwise.
+# main.py imports this too, so config and term files share one loader.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 ROOT      = Path(__file__).parent.parent
 TERMS_DIR = ROOT / "data" / "terms"
 
@@ -117,7 +124,7 @@ def load_or_generate(topic_id: str, name: str, description: str) -> list[str]:
     """
     path = _terms_path(topic_id)
     if path.exists():
-        payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+        payload = yaml.load(path.read_text(encoding="utf-8"), Loader=YamlLoader)
         terms   = payload.get("terms", [])
         print(f"[terms] Loaded {len(terms)} terms for '{name}' ← {path.name}")
         return terms
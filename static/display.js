@@ -30,6 +30,20 @@ const DigestDisplay = (() => {
   };
   const MISC_ACCENT = "#e2e8f0";
 
+  // Every deselected chip looks the same, so there is no per-topic map for it
+  const INACTIVE_STYLE = {
+    background: "#f1f5f9", color: "#94a3b8", borderColor: "#e2e8f0"
+  };
+
+  // ── HTML escaping ──────────────────────────────────────────────────────────
+  // Topic names come from the data files and go into chip markup, so they
+  // are escaped rather than trusted. Paper text is set via textContent.
+  const ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+
+  function _esc(s) {
+    return String(s).replace(/[&<>"']/g, c => ESCAPES[c]);
+  }
+
   // ── Match method badge ─────────────────────────────────────────────────────
   function _methodBadge(method) {
     if (method === "keyword" || method === "both") {
@@ -42,26 +56,29 @@ const DigestDisplay = (() => {
   }
 
   // ── Topic style maps ───────────────────────────────────────────────────────
-  let activeStyles   = {};
-  let inactiveStyles = {};
-  let accentColors   = {};
-  let allTopics      = [];
+  let activeStyles = {};
+  let accentColors = {};
+  let chipHtml     = {};   // topic → card chip markup, built once per topic
+  let allTopics    = [];
+
+  function _topicChip(t, s) {
+    return `<span class="topic-chip" style="background:${s.background};color:${s.color};border-color:${s.borderColor}">${_esc(t)}</span>`;
+  }
 
   function buildTopicStyles(topics) {
     allTopics = topics;
     let palIdx = 0;
     topics.forEach((t) => {
       if (t === "misc") {
-        activeStyles[t]   = MISC_STYLE;
-        inactiveStyles[t] = { background: "#f1f5f9", color: "#94a3b8", borderColor: "#e2e8f0" };
-        accentColors[t]   = MISC_ACCENT;
-        return;
+        activeStyles[t] = MISC_STYLE;
+        accentColors[t] = MISC_ACCENT;
+      } else {
+        const pal = CHIP_PALETTES[palIdx % CHIP_PALETTES.length];
+        activeStyles[t] = { background: pal[0], color: pal[1], borderColor: pal[2] };
+        accentColors[t] = pal[3];
+        palIdx++;
       }
-      const pal = CHIP_PALETTES[palIdx % CHIP_PALETTES.length];
-      activeStyles[t]   = { background: pal[0], color: pal[1], borderColor: pal[2] };
-      inactiveStyles[t] = { background: "#f1f5f9", color: "#94a3b8", borderColor: "#e2e8f0" };
-      accentColors[t]   = pal[3];
-      palIdx++;
+      chipHtml[t] = _topicChip(t, activeStyles[t]);
     });
   }
 
@@ -217,47 +234,80 @@ const DigestDisplay = (() => {
   }
 
   function _applyChipStyle(el, t, on) {
-    const s = on ? (activeStyles[t] || MISC_STYLE) : (inactiveStyles[t] || MISC_STYLE);
+    const s = on ? (activeStyles[t] || MISC_STYLE) : INACTIVE_STYLE;
     el.style.background  = s.background;
     el.style.color       = s.color;
     el.style.borderColor = s.borderColor;
   }
 
   // ── Paper card ─────────────────────────────────────────────────────────────
+  // Every optional part is present in the prototype; buildCard removes what
+  // a given paper doesn't use.
+  let cardProto = null;
+
+  function _cardPrototype() {
+    if (!cardProto) {
+      cardProto = document.createElement("div");
+      cardProto.className = "paper";
+      cardProto.innerHTML = `
+        <span class="backfilled-badge">⚡ Late addition</span>
+        <a class="paper-title" target="_blank"></a>
+        <div class="paper-authors"></div>
+        <div class="abstract-preview"></div>
+        <div class="abstract-full"></div>
+        <button class="expand-btn">Show more ↓</button>
+        <div class="paper-footer"><a class="pdf-link" target="_blank">PDF →</a></div>
+      `;
+    }
+    return cardProto;
+  }
+
   function buildCard(p) {
     const isMisc  = (p.matched_topics || []).length === 1 && p.matched_topics[0] === "misc";
     const preview = p.abstract.slice(0, 320) + (p.abstract.length > 320 ? "…" : "");
     const hasMore = p.abstract.length > 320;
     const accent  = accentColors[(p.matched_topics || [])[0]] || "#cbd5e1";
 
-    const chips = (p.matched_topics || []).map(t => {
-        const s = activeStyles[t] || MISC_STYLE;
-        return `<span class="topic-chip" style="background:${s.background};color:${s.color};border-color:${s.borderColor}">${t}</span>`;
-      }).join("")
+    const chips = (p.matched_topics || []).map(t => chipHtml[t] || _topicChip(t, MISC_STYLE)).join("")
       + (isMisc ? `<span class="score-badge">score ${p.best_score}</span>` : "");
 
     const authorsArr = p.authors || [];
     const authorsStr = authorsArr.slice(0, 3).join(", ") + (authorsArr.length > 3 ? " et al." : "");
     const uid    = p.id.replace(/[^a-zA-Z0-9]/g, "-");
     const pdfUrl = p.url.replace("/abs/", "/pdf/");
-    const backfilledBadge = p.backfilled
-      ? `<span class="backfilled-badge">⚡ Late addition</span>`
-      : "";
 
-    const card = document.createElement("div");
+    // Clone the parsed skeleton and fill it through DOM properties — no
+    // HTML re-parse per card, and text fields never pass through innerHTML.
+    const card = _cardPrototype().cloneNode(true);
+    const $    = sel => card.querySelector(sel);
     card.className = "paper" + (isMisc ? " irrelevant" : "");
     card.style.borderLeftColor = accent;
-    card.innerHTML = `
-      ${backfilledBadge}
-      <a class="paper-title" href="${p.url}" target="_blank">${p.title}</a>
-      <div class="paper-authors">${authorsStr}</div>
-      <div class="abstract-preview" id="pv-${uid}">${preview}</div>
-      ${hasMore ? `
-        <div class="abstract-full" id="fl-${uid}">${p.abstract}</div>
-        <button class="expand-btn" id="btn-${uid}" onclick="DigestDisplay.toggle('${uid}')">Show more ↓</button>
-      ` : ""}
-      <div class="paper-footer">${chips}<a class="pdf-link" href="${pdfUrl}" target="_blank">PDF →</a></div>
-    `;
+
+    if (!p.backfilled) $(".backfilled-badge").remove();
+
+    const title = $(".paper-title");
+    title.href        = p.url;
+    title.textContent = p.title;
+    $(".paper-authors").textContent = authorsStr;
+
+    const pv = $(".abstract-preview");
+    pv.id          = "pv-" + uid;
+    pv.textContent = preview;
+
+    const fl  = $(".abstract-full");
+    const btn = $(".expand-btn");
+    if (hasMore) {
+      fl.id          = "fl-" + uid;
+      fl.textContent = p.abstract;
+      btn.id         = "btn-" + uid;
+      btn.onclick    = () => toggle(uid);
+    } else {
+      fl.remove();
+      btn.remove();
+    }
+
+    $(".pdf-link").href = pdfUrl;
+    $(".paper-footer").insertAdjacentHTML("afterbegin", chips);
     return card;
   }
 
@@ -273,6 +323,33 @@ const DigestDisplay = (() => {
     btn.textContent   = expanded ? "Show more ↓" : "Show less ↑";
   }
 
+  // ── Paper selection (shared by index.html and date.html) ───────────────────
+  function splitPapers(papers) {
+    const matched = [], unmatched = [];
+    papers.forEach(p =>
+      (p.matched_topics && p.matched_topics.length ? matched : unmatched).push(p));
+    return { matched, unmatched };
+  }
+
+  // Topics in order of first appearance, plus the catch-all "misc"
+  function collectTopics(papers) {
+    const topicSet = new Set();
+    papers.forEach(p => (p.matched_topics || []).forEach(t => topicSet.add(t)));
+    return [...topicSet, "misc"];
+  }
+
+  // Matched papers with an active topic, then unmatched ones tagged "misc"
+  // if that chip is on. Returns { papers, matchedCount }.
+  function visiblePapers(papers, activeTopics) {
+    const { matched, unmatched } = splitPapers(papers);
+    const shown = matched.filter(p => p.matched_topics.some(t => activeTopics.has(t)));
+    const matchedCount = shown.length;
+    if (activeTopics.has("misc")) {
+      unmatched.forEach(p => shown.push({ ...p, matched_topics: ["misc"] }));
+    }
+    return { papers: shown, matchedCount };
+  }
+
   // ── Render paper lists ─────────────────────────────────────────────────────
   function renderList({ containerId, paginationId, papers, page, onPage }) {
     const list = document.getElementById(containerId);
@@ -346,6 +423,9 @@ const DigestDisplay = (() => {
     buildFilterChips,
     buildCard,
     toggle,
+    splitPapers,
+    collectTopics,
+    visiblePapers,
     renderList,
     renderPagination,
     openSidebar,
@@ -0,0 +1,88 @@
+"""
+test_filter.py — filter_days must give each day the same result filter_papers
+would give it alone, even when one paper ID appears on two days.
+
+Run from the repo root:  python -m pytest -q
+"""
+
+import importlib.util
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+import embedding_cache
+import filter as filt
+from fetcher import Paper
+from filter  import Topic, filter_days, filter_papers
+
+D1 = date(2026, 1, 1)
+D5 = date(2026, 1, 20)
+
+
+def _paper(pid: str, title: str, abstract: str, day: date) -> Paper:
+    ts = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return Paper(id=pid, title=title, abstract=abstract, authors=["A"],
+                 url=f"https://arxiv.org/abs/{pid}", published=ts, updated=ts,
+                 categories=["cs.AI"])
+
+
+class _FakeModel:
+    """Embeds text on one axis per keyword — enough to drive the threshold."""
+    device = SimpleNamespace(type="cpu")
+    _axes  = ("symbolic", "graph", "zzz")
+
+    def encode(self, texts, **_):
+        vecs = np.array([[1.0 if w in t.lower() else 0.0 for w in self._axes] for t in texts])
+        vecs[:, -1] += 0.1   # never all-zero
+        return (vecs / np.linalg.norm(vecs, axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture
+def fake_semantic(monkeypatch, tmp_path):
+    """Semantic layer on, with a fake model and a throwaway embedding cache."""
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec",
+                        lambda name, *a: object() if name == "sentence_transformers"
+                        else real_find_spec(name, *a))
+    monkeypatch.setattr(filt, "_get_model", lambda name=filt._MODEL: _FakeModel())
+    monkeypatch.setattr(embedding_cache, "CACHE_DIR", tmp_path)
+    filt._encode_topics.cache_clear()
+    yield
+    filt._encode_topics.cache_clear()
+
+
+def _assert_matches_per_day(papers_by_day, topics):
+    batched = filter_days(papers_by_day, topics)
+    for day, papers in papers_by_day.items():
+        assert batched[day] == filter_papers(papers, topics)
+
+
+def test_revised_paper_keyword_does_not_leak_across_days():
+    topics = [Topic("symbolic", "Symbolic", ["symbolic"], "symbolic reasoning")]
+    v1 = _paper("2601.00001", "A symbolic method", "We use symbolic rules.", D1)
+    v2 = _paper("2601.00001", "Revised", "nothing relevant now", D5)
+    by_day = {D1: [v1], D5: [v2]}
+
+    _assert_matches_per_day(by_day, topics)
+    matched, unmatched = filter_days(by_day, topics)[D5]
+    assert matched == [] and unmatched[0].paper is v2
+
+
+def test_revised_paper_semantic_does_not_leak_across_days(fake_semantic):
+    topics = [Topic("sym", "Symbolic", ["neurosymbolic"], "symbolic"),
+              Topic("kg",  "Graphs",   ["knowledge base"], "graph")]
+    v1 = _paper("2601.00002", "Symbolic planning", "", D1)
+    v2 = _paper("2601.00002", "Graph planning", "", D5)
+    other = _paper("2601.00003", "Unrelated", "", D5)
+    by_day = {D1: [v1], D5: [v2, other]}
+
+    _assert_matches_per_day(by_day, topics)
+    results = filter_days(by_day, topics)
+    assert results[D1][0][0].matched_topics == ["Symbolic"]
+    assert results[D5][0][0].matched_topics == ["Graphs"]